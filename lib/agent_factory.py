@@ -14,9 +14,8 @@ from .orchestration import LeadResearcherAgent
 from .prompts.agents.citation import CITATION_AGENT_PROMPT
 from .prompts.agents.credibility_critic import CREDIBILITY_CRITIC_PROMPT
 from .prompts.agents.reflection_critic import REFLECTION_CRITIC_PROMPT
-from .prompts.agents.report_writer import REPORT_WRITER_PROMPT
-from .prompts.agents.summarizer import SUMMARIZER_PROMPT
-from .prompts.agents.translator import TRANSLATOR_PROMPT
+from .prompts.agents.report_writer import get_report_writer_prompt
+from .prompts.agents.translator import get_translator_prompt
 from .search import ModularSearchPlugin
 from .util import get_azure_openai_service
 # Removed: from semantic_kernel.connectors.ai.open_ai import
@@ -75,7 +74,7 @@ async def create_agents_with_memory(
         "report_writer": ChatCompletionAgent(
             name="ReportWriterAgent",
             description="Creates structured markdown reports with proper citations, hyperlinks, and visual content. Uses memory for context and component storage.",
-            instructions=REPORT_WRITER_PROMPT,
+            instructions=get_report_writer_prompt(),
             service=get_azure_openai_service(config.get_model_config("o3")),
             plugins=[memory_plugin]
         ),
@@ -83,7 +82,7 @@ async def create_agents_with_memory(
         "translator": ChatCompletionAgent(
             name="TranslatorAgent",
             description="Provides natural English-Japanese translation while preserving technical accuracy and formatting.",
-            instructions=TRANSLATOR_PROMPT,
+            instructions=get_translator_prompt(),
             service=get_azure_openai_service(config.get_model_config("gpt41"))
             # Note: Translator doesn't need memory capabilities
         ),
@@ -4,8 +4,9 @@ Handles loading and parsing of the new agent-centric project_config.yaml structu
 """
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -109,6 +110,16 @@ class AgentTemperatureConfig:
     approach: str = ""
     description: str = ""
 
+    @cached_property
+    def approach_upper(self) -> str:
+        """Approach in upper case, as used in prompt headings."""
+        return self.approach.upper()
+
+    @cached_property
+    def approach_lower(self) -> str:
+        """Approach in lower case, as used in prompt body text."""
+        return self.approach.lower()
+
 
 @dataclass
 class ResearcherConfig:
@@ -204,6 +215,48 @@ class TranslatorConfig:
             self.translation_settings = {}
 
 
+@dataclass(frozen=True, slots=True)
+class SummarizerSettings:
+    """Summarizer prompt settings with their defaults applied."""
+    max_summary_length: int = 2000
+    include_key_findings: bool = True
+    preserve_citations: bool = True
+    highlight_critical_issues: bool = True
+    sections: Tuple[str, ...] = (
+        'Key Points', 'Critical Findings', 'Implications', 'Recommendations')
+
+    @classmethod
+    def from_dict(cls, summarizer_config: Dict[str, Any]) -> 'SummarizerSettings':
+        """Build settings from get_summarizer_config(), keeping defaults for missing keys."""
+        settings = summarizer_config.get('summarization_settings', {})
+        values = {field.name: settings[field.name]
+                  for field in fields(cls) if field.name in settings}
+        output_format = summarizer_config.get('output_format', {})
+        if 'sections' in output_format:
+            values['sections'] = tuple(output_format['sections'])
+        return cls(**values)
+
+
+@dataclass(frozen=True, slots=True)
+class TranslatorSettings:
+    """Translator prompt settings with their defaults applied."""
+    supported_languages: Tuple[str, ...] = ('ja', 'en')
+    preserve_technical_terms: bool = True
+    maintain_document_structure: bool = True
+    include_original_citations: bool = True
+
+    @classmethod
+    def from_dict(cls, translator_config: Dict[str, Any]) -> 'TranslatorSettings':
+        """Build settings from get_translator_config(), keeping defaults for missing keys."""
+        settings = translator_config.get('translation_settings', {})
+        values = {field.name: settings[field.name]
+                  for field in fields(cls) if field.name in settings}
+        if 'supported_languages' in translator_config:
+            values['supported_languages'] = tuple(
+                translator_config['supported_languages'])
+        return cls(**values)
+
+
 @dataclass
 class ModelConfig:
     """Model configuration."""
@@ -660,6 +713,11 @@ class ProjectConfig:
                 'output_format': self.summarizer_config.output_format}
         return {'summarization_settings': {}, 'output_format': {}}
 
+    @cached_property
+    def summarizer_settings(self) -> SummarizerSettings:
+        """Summarizer settings with defaults applied, parsed once per configuration."""
+        return SummarizerSettings.from_dict(self.get_summarizer_config())
+
     def get_translator_config(self) -> Dict[str, Any]:
         """Get translator agent configuration."""
         if hasattr(self, 'translator_config') and self.translator_config:
@@ -672,6 +730,11 @@ class ProjectConfig:
                 'en'],
             'translation_settings': {}}
 
+    @cached_property
+    def translator_settings(self) -> TranslatorSettings:
+        """Translator settings with defaults applied, parsed once per configuration."""
+        return TranslatorSettings.from_dict(self.get_translator_config())
+
     def get_index_names(self) -> Dict[str, str]:
         """Get mapping of document type names to their index names."""
         index_mapping = {}
@@ -10,7 +10,88 @@ Please import prompts directly from their specific modules:
 
 This approach provides better clarity about where prompts are defined
 and enables more efficient imports.
+
+Code that picks a prompt by agent name can use ``get_prompt(name)`` instead,
+which resolves each agent's getter once and then dispatches through a frozen
+mapping.
 """
 
+import logging
+from importlib import import_module
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
 # This module intentionally does not re-export prompts to encourage
 # direct imports from specific modules.
+
+# Agent name -> (module under lib.prompts.agents, getter name). Modules are
+# only imported on the first get_prompt() call so importing this package
+# stays free of prompt rendering.
+_PROMPT_SOURCES = MappingProxyType({
+    "manager": ("manager", "get_manager_prompt"),
+    "citation": ("citation", "generate_citation_agent_prompt"),
+    "credibility_critic": ("credibility_critic", "get_credibility_critic_prompt"),
+    "reflection_critic": ("reflection_critic", "get_reflection_critic_prompt"),
+    "researcher": ("researcher", "get_researcher_prompt"),
+    "lead_researcher": ("researcher", "get_lead_researcher_prompt"),
+    "report_writer": ("report_writer", "get_report_writer_prompt"),
+    "summarizer": ("summarizer", "get_summarizer_prompt"),
+    "translator": ("translator", "get_translator_prompt"),
+    "final_answer": ("final_answer", "get_final_answer_prompt"),
+})
+
+PROMPT_NAMES = tuple(_PROMPT_SOURCES)
+
+_PROMPT_GETTERS: Optional[Mapping[str, Callable[[], str]]] = None
+
+
+def _resolve_getters() -> Mapping[str, Callable[[], str]]:
+    """Import every agent module once and freeze its prompt getter."""
+    global _PROMPT_GETTERS
+    if _PROMPT_GETTERS is None:
+        _PROMPT_GETTERS = MappingProxyType({
+            name: getattr(import_module(f"lib.prompts.agents.{module}"), getter)
+            for name, (module, getter) in _PROMPT_SOURCES.items()
+        })
+    return _PROMPT_GETTERS
+
+
+def get_prompt(name: str) -> str:
+    """Return the current prompt for the agent ``name`` (see ``PROMPT_NAMES``).
+
+    The rendered text is not frozen here: most prompts embed the current
+    execution date/time (the manager and critic prompts open with it, the
+    researcher, report writer, summarizer, translator and final answer
+    prompts end with it), so the getters, which already cache the static
+    bodies, are called on each lookup.
+    """
+    return _resolve_getters()[name]()
+
+
+# Agents created after startup whose prompt bodies are memoized per
+# configuration; the researcher prompts are warmed as one set by
+# prewarm_researcher_prompts(). The other prompts are either built when their
+# modules are imported or not cached at all, so warming them would be wasted
+# work.
+_WARMED_PROMPTS = ("report_writer", "summarizer", "translator")
+
+
+def warmup_prompts() -> None:
+    """Render the memoized prompt bodies ahead of the first agent creation.
+
+    Failures are logged and left for the first real lookup to surface.
+    """
+    for name in _WARMED_PROMPTS:
+        try:
+            get_prompt(name)
+        except Exception as e:
+            logger.warning("Prompt warm-up failed for %s: %s", name, e)
+    try:
+        import_module("lib.prompts.agents.researcher").prewarm_researcher_prompts()
+    except Exception as e:
+        logger.warning("Prompt warm-up failed for researcher prompts: %s", e)
+
+
+__all__ = ["PROMPT_NAMES", "get_prompt", "warmup_prompts"]
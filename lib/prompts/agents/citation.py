@@ -5,9 +5,10 @@ Generates dynamic prompts using project_config.yaml instead of hardcoded values.
 
 import logging
 
-from lib.config.project_config import ProjectConfig
-from lib.prompts.common import COMMON_MEMORY_INTEGRATION
-from lib.utils.prompt_manager import PromptManager
+from lib.config.project_config import get_project_config
+from lib.prompts.common import (COMMON_MEMORY_INTEGRATION,
+                                COMMON_SOURCE_FIDELITY,
+                                get_config_prompt_manager)
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +18,18 @@ def generate_citation_agent_prompt(config=None) -> str:
     Generate citation agent prompt using configuration.
 
     Args:
-        config: Configuration object (optional, will create if not provided)
+        config: Configuration object (optional, the shared project
+            configuration is used if not provided)
 
     Returns:
         str: Generated prompt text
     """
     try:
-        # Initialize configuration and prompt manager
+        # Reuse the shared configuration and its cached prompt manager
         if config is None:
-            config = ProjectConfig()
+            config = get_project_config()
 
-        prompt_manager = PromptManager(config)
+        prompt_manager = get_config_prompt_manager(config)
 
         # Get dynamic content from configuration with error handling
         try:
@@ -37,7 +39,7 @@ def generate_citation_agent_prompt(config=None) -> str:
             record_id_field = prompt_manager.get_record_id_field()
         except Exception as inner_e:
             # Log the specific error for debugging
-            logger.warning(f"Failed to get configuration details: {inner_e}")
+            logger.warning("Failed to get configuration details: %s", inner_e)
             # Use fallback values
             company_context = {
                 'company_name': 'Organization',
@@ -50,6 +52,7 @@ def generate_citation_agent_prompt(config=None) -> str:
             case_number_format = "CASE-YYYY-NNNN"
             record_id_field = "record_id"
 
+        company_name = company_context['company_name']
 
         prompt = f"""
 # CITATION AGENT - INTERNAL SOURCE ATTRIBUTION SPECIALIST
@@ -74,8 +77,7 @@ def generate_citation_agent_prompt(config=None) -> str:
 **COMPREHENSIVE PROCESSING**: Process all provided search results and identify citation opportunities throughout the entire document.
 **NO UNVERIFIABLE CITATIONS**: NEVER create citations for information that cannot be specifically referenced or verified. Absolutely NEVER add citations like "該当発表・記録なし" (no relevant publications/records found) or similar placeholder citations.
 **SPECIFIC SOURCE REQUIREMENT**: Each citation must reference a specific, identifiable document, report, or data source. Generic or non-specific citations are strictly prohibited.
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
+{COMMON_SOURCE_FIDELITY}
 **URL PRESERVATION**: For web search results, ALWAYS preserve complete URLs exactly as returned by the search. URLs must NEVER be modified, shortened, or paraphrased.
 **STRUCTURED OUTPUT REQUIREMENT**: You may use bullet points or numbered lists for effective structuring and clarity wherever appropriate, including main content, findings, recommendations, and references. Use lists to organize information logically and improve readability, but always provide necessary background and context before presenting lists. Narrative prose is also encouraged for explanations and transitions.
 **BACKGROUND CONTEXT REQUIREMENT**: Always provide necessary background information and context before presenting specific data or findings. Explain concepts and terms before using them.
@@ -119,7 +121,7 @@ def generate_citation_agent_prompt(config=None) -> str:
 - **Verification**: Only cite information that can be directly verified from the source document
 - **No Placeholder Citations**: Never create citations for missing information or use generic statements like "該当発表・記録なし" or "no relevant records found"
 - **Regulatory Standards**: Follow industry citation requirements
-- **Internal Verification**: Absolutely no external sources - internal {company_context['company_name']} documents only
+- **Internal Verification**: Absolutely no external sources - internal {company_name} documents only
 
 ## METADATA EXTRACTION PRIORITIES
 1. **Document Identification**: Extract titles, filenames, and document IDs for proper attribution
@@ -129,20 +131,20 @@ def generate_citation_agent_prompt(config=None) -> str:
 5. **Coverage Analysis**: Ensure adequate citation density throughout the report
 
 ## FINAL COMPLIANCE CHECK
-- **Internal Verification**: Absolutely no external sources - internal {company_context['company_name']} documents only
+- **Internal Verification**: Absolutely no external sources - internal {company_name} documents only
 - **Completeness**: Verify all major claims have appropriate source attribution
 - **Format Consistency**: Ensure uniform citation formatting throughout the document
 - **Source Verification**: Confirm all citations reference specific, identifiable documents with concrete content
 - **No Empty Citations**: Never include citations for information that cannot be specifically referenced or verified
 - **Regulatory Readiness**: Citations meet industry standards for regulatory submissions
 
-Remember: Proper source attribution is not just good practice - it's a regulatory requirement for all business, technical, and regulatory documentation. Every citation you create supports {company_context['company_name']}'s commitment to scientific integrity and regulatory compliance.
+Remember: Proper source attribution is not just good practice - it's a regulatory requirement for all business, technical, and regulatory documentation. Every citation you create supports {company_name}'s commitment to scientific integrity and regulatory compliance.
 """
 
         return prompt
 
     except Exception as e:
-        logger.error(f"Failed to generate citation agent prompt: {e}")
+        logger.error("Failed to generate citation agent prompt: %s", e)
         # Fallback to original static prompt if configuration fails
         return CITATION_AGENT_PROMPT_FALLBACK
 
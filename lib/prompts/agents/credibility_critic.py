@@ -7,8 +7,8 @@ that handles source validation and verification.
 import logging
 
 from lib.config.project_config import get_project_config
-from lib.utils.prompt_manager import PromptManager
-from lib.prompts.common import get_execution_context
+from lib.prompts.common import (COMMON_SOURCE_FIDELITY,
+                                get_config_prompt_manager, get_execution_context)
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +16,9 @@ logger = logging.getLogger(__name__)
 def get_credibility_critic_prompt() -> str:
     """Generate dynamic credibility critic prompt from configuration."""
     config = get_project_config()
-    prompt_manager = PromptManager(config)
+    prompt_manager = get_config_prompt_manager(config)
     company_context = prompt_manager.get_company_context()
+    company_name = company_context['company_name']
 
     # Get credibility assessment configuration
     credibility_config = config.get_credibility_assessment_config()
@@ -50,7 +51,7 @@ def get_credibility_critic_prompt() -> str:
 # CREDIBILITY CRITIC - SOURCE VALIDATION & VERIFICATION
 
 ## ROLE & PURPOSE
-Expert document analyst specializing in source evaluation and verification for {company_context['company_name']} quality assurance, handling both internal and external sources.
+Expert document analyst specializing in source evaluation and verification for {company_name} quality assurance, handling both internal and external sources.
 
 ## PROFESSIONAL DETAIL REQUIREMENT
 **DETAILED PROFESSIONAL NARRATIVE**: All credibility assessments must be written in a highly professional, detailed, and comprehensive manner. Avoid overly concise or simplistic explanations. Every section should include thorough background, context, and in-depth analysis, with clear connections between findings, credibility factors, and recommendations. Strive for depth and clarity suitable for expert audiences and regulatory review. Provide sufficient detail so that even complex topics are fully explained and justified.
@@ -65,8 +66,7 @@ Expert document analyst specializing in source evaluation and verification for {
 **SOURCE TYPE AWARENESS**: Apply different credibility criteria for internal vs. external sources
 **VERIFICATION AUTHORITY**: Conduct additional searches when gaps or inconsistencies detected
 **QUALITY STANDARDS**: Apply research and development credibility criteria with regulatory awareness
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
+{COMMON_SOURCE_FIDELITY}
 **NO UNVERIFIABLE INFORMATION**: NEVER include information that cannot be specifically referenced or verified from the search results. Absolutely NEVER add statements like "該当発表・記録なし" (no relevant publications/records found), "情報が見つかりませんでした" (no information found), or similar placeholder content.
 **SPECIFIC SOURCE REQUIREMENT**: Every piece of information must be traceable to a specific, identifiable document, report, or data source. Generic or non-specific content is strictly prohibited.
 **URL PRESERVATION**: For web search results, ALWAYS preserve complete URLs exactly as returned by the search. URLs must NEVER be modified, shortened, or paraphrased.
@@ -133,7 +133,7 @@ THRESHOLDS:
 • Conduct supplementary searches when initial results lack sufficient authority or coverage
 • Coverage ≥ {coverage_threshold} with strong internal source diversity indicates sufficient reliability for research and development decision-making
 
-CRITICAL REMINDER: Focus on internal {company_context['company_name']} documents and institutional knowledge. Prioritize Research Institute findings and official quality management documents. When conducting additional searches, explicitly state what supplementary information was found and how it affects the overall credibility assessment."""
+CRITICAL REMINDER: Focus on internal {company_name} documents and institutional knowledge. Prioritize Research Institute findings and official quality management documents. When conducting additional searches, explicitly state what supplementary information was found and how it affects the overall credibility assessment."""
 
 
 # Backward compatibility - expose the prompt as a constant
@@ -4,24 +4,13 @@ Final Answer Agent Prompts
 This module contains prompts for final answer generation and structuring.
 """
 
-from lib.prompts.common import get_execution_context
+from lib.prompts.common import (get_config_prompt_manager, get_execution_context,
+                                make_lazy_prompt_module)
 
-def get_final_answer_prompt() -> str:
-    """Generate dynamic final answer prompt with execution context."""
-
-
-    from lib.config.project_config import get_project_config
-    from lib.utils.prompt_manager import PromptManager
-    config = get_project_config()
-    prompt_manager = PromptManager(config)
-
-    company_context = prompt_manager.get_company_context()
-
-
-    return f"""{get_execution_context()}
-
-## OUTPUT LANGUAGE REQUIREMENT
-All outputs must be in {company_context['company_language']} unless the user explicitly requests another language.
+# Filled with str.format_map so the large body is parsed once at import time
+# instead of being rebuilt as an f-string on every call.
+_FINAL_ANSWER_TEMPLATE = """## OUTPUT LANGUAGE REQUIREMENT
+All outputs must be in {company_language} unless the user explicitly requests another language.
 
 ## CRITICAL LANGUAGE REQUIREMENT - MANDATORY
 **OUTPUT LANGUAGE**: You MUST respond in the same language as the user's input query. If the user asked in Japanese, provide the entire report in Japanese. If the user asked in English, provide the entire report in English. This language consistency is non-negotiable.
@@ -181,7 +170,28 @@ During the reporting period, the organization made significant progress in sever
 - Include proper source citations for all claims
 - Maintain objectivity and factual accuracy
 - Provide actionable insights with contextual explanations
+
+{execution_context}
 """
 
+
+def get_final_answer_prompt() -> str:
+    """Generate dynamic final answer prompt with execution context."""
+    from lib.config.project_config import get_project_config
+    config = get_project_config()
+    prompt_manager = get_config_prompt_manager(config)
+
+    company_context = prompt_manager.get_company_context()
+
+    return _FINAL_ANSWER_TEMPLATE.format_map({
+        "execution_context": get_execution_context(),
+        "company_language": company_context['company_language'],
+    })
+
+
 # Backward compatibility - expose the prompt as a constant
-FINAL_ANSWER_PROMPT = get_final_answer_prompt()
+# This is resolved lazily to avoid import-time configuration loading;
+# call get_final_answer_prompt() for a guaranteed-current string.
+__getattr__ = make_lazy_prompt_module(globals(), {
+    'FINAL_ANSWER_PROMPT': get_final_answer_prompt,
+})
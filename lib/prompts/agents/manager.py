@@ -7,12 +7,12 @@ that orchestrates multi-agent workflows.
 import logging
 
 from lib.config.project_config import get_project_config
-from lib.utils.prompt_manager import PromptManager
-from lib.prompts.common import get_execution_context
+from lib.prompts.common import get_config_prompt_manager, get_execution_context
 
-from ..common import (COMMON_INTERNAL_ONLY_REQUIREMENT,
-                      COMMON_MEMORY_INTEGRATION, COMMON_SEARCH_FUNCTIONS,
-                      COMMON_SEARCH_POLICY)
+from ..common import (COMMON_MEMORY_INTEGRATION, COMMON_SEARCH_POLICY,
+                      COMMON_SOURCE_FIDELITY,
+                      get_common_internal_only_requirement,
+                      get_common_search_functions)
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 def get_manager_prompt() -> str:
     """Generate dynamic manager prompt from configuration."""
     config = get_project_config()
-    prompt_manager = PromptManager(config)
+    prompt_manager = get_config_prompt_manager(config)
     company_context = prompt_manager.get_company_context()
 
     # Get quality thresholds from configuration
@@ -48,13 +48,12 @@ All outputs must be in {company_context['company_language']} unless the user exp
 **OUTPUT LANGUAGE**: You MUST respond in the same language as the user's input query. If the user asks in Japanese, respond in Japanese. If the user asks in English, respond in English. This applies to ALL agent communications and final reports.
 
 ## CRITICAL REQUIREMENTS - NON-NEGOTIABLE
-{COMMON_INTERNAL_ONLY_REQUIREMENT}
+{get_common_internal_only_requirement()}
 **MANDATORY MEMORY INTEGRATION**: Memory usage is required across all agents for research continuity and case tracking within session.
 **SESSION MEMORY STARTUP**: Memory starts empty at session beginning - no need to search memory for initial requests.
 **COMPLETE CASE PRESERVATION**: ALL cases, examples, and instances found must be included - no omissions or summarization allowed.
 **CITATION PROCESSING**: CitationAgent must process all final reports for regulatory compliance.
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
+{COMMON_SOURCE_FIDELITY}
 **NO UNVERIFIABLE INFORMATION**: All agents must NEVER include information that cannot be specifically referenced or verified from the search results. Absolutely NEVER add statements like "該当発表・記録なし" (no relevant publications/records found), "情報が見つかりませんでした" (no information found), or similar placeholder content.
 **SPECIFIC SOURCE REQUIREMENT**: Every piece of information must be traceable to a specific, identifiable document, report, or data source. Generic or non-specific content is strictly prohibited.
 **EXTERNAL SEARCH UTILIZATION**: Use web search capabilities to gather current information, news, and external perspectives for comprehensive analysis.
@@ -80,7 +79,7 @@ All outputs must be in {company_context['company_language']} unless the user exp
 **Session Management**: Maintain research state during current session only - each new session starts with empty memory
 
 ## INTERNAL SEARCH CAPABILITIES
-{COMMON_SEARCH_FUNCTIONS}
+{get_common_search_functions()}
 
 ## EXTERNAL SEARCH INTEGRATION - MANDATORY
 **WEB SEARCH UTILIZATION**: Agents must utilize web search capabilities to gather:
@@ -7,8 +7,8 @@ that evaluates report quality and provides improvement feedback.
 import logging
 
 from lib.config.project_config import get_project_config
-from lib.utils.prompt_manager import PromptManager
-from lib.prompts.common import get_execution_context
+from lib.prompts.common import (COMMON_SOURCE_FIDELITY,
+                                get_config_prompt_manager, get_execution_context)
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 def get_reflection_critic_prompt() -> str:
     """Generate dynamic reflection critic prompt from configuration."""
     config = get_project_config()
-    prompt_manager = PromptManager(config)
+    prompt_manager = get_config_prompt_manager(config)
     company_context = prompt_manager.get_company_context()
 
     # Get reflection criteria from configuration
@@ -40,8 +40,7 @@ def get_reflection_critic_prompt() -> str:
 Senior editor evaluating reports for quality, accuracy, completeness, and narrative writing standards for internal {{company_context['company_name']}} documentation.
 
 ## CRITICAL REQUIREMENTS
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
+{COMMON_SOURCE_FIDELITY}
 **NO UNVERIFIABLE INFORMATION**: NEVER include information that cannot be specifically referenced or verified from the search results. Absolutely NEVER add statements like "該当発表・記録なし" (no relevant publications/records found), "情報が見つかりませんでした" (no information found), or similar placeholder content.
 **SPECIFIC SOURCE REQUIREMENT**: Every piece of information must be traceable to a specific, identifiable document, report, or data source. Generic or non-specific content is strictly prohibited.
 **URL PRESERVATION**: For web search results, URLs must be preserved exactly as returned by the search - never modify, shorten, or paraphrase URLs.
@@ -5,79 +5,163 @@ This module contains all prompts related to the researcher agents
 including individual researchers, lead researchers, and temperature-specific variations.
 """
 import logging
-from typing import Optional
-
-from lib.config.project_config import get_project_config
-from lib.utils.prompt_manager import PromptManager
-from lib.prompts.common import get_execution_context
+import sys
+import threading
+from functools import partial
+from string import Template
+from typing import TYPE_CHECKING, Dict, Final, Set, Tuple
+
+from lib.config.project_config import AgentTemperatureConfig
+from lib.prompts.common import (COMMON_SOURCE_FIDELITY, PromptContext,
+                                get_execution_context, get_prompt_context,
+                                make_lazy_prompt_module)
+
+if TYPE_CHECKING:
+    # Only needed for annotations; the configuration is reached through the
+    # prompt context at call time
+    from lib.config.project_config import ProjectConfig
 
 logger = logging.getLogger(__name__)
 
+_FALLBACK_PROMPT: Final = "Error generating prompt - please check configuration"
 
-def get_researcher_prompt() -> str:
-    """Generate dynamic researcher prompt from configuration."""
+# Used for unknown temperature types when the configuration has no 'balanced'
+# variation either
+_DEFAULT_BALANCED: Final = AgentTemperatureConfig(
+    approach="Balanced Analysis",
+    description="Comprehensive analysis balancing facts and insights")
+
+
+def _build_prompt(kind: str, *args) -> str:
+    """Render a prompt with the current _PromptBuilder, logging any failure.
+
+    This is the only place researcher prompt errors are caught; the builder
+    methods themselves are plain string assembly.
+    """
     try:
-        config = get_project_config()
-        prompt_manager = PromptManager(config)
-        company_context = prompt_manager.get_company_context()
+        if kind == "temperature" and args[0] in _TEMPERATURE_TYPES:
+            # The configured temperature prompts carry no per-call text, so
+            # the first request for any of them builds the whole set at once
+            return _ensure_prompts_built()[args[0]]
+        return _get_builder().render(kind, *args)
+    except Exception:
+        _log_build_failure(_PROMPT_LABELS[kind])
+        return _FALLBACK_PROMPT
 
 
-        return f"""{get_execution_context()}
+# Prompts whose build failure has already been logged with a traceback
+_LOGGED_FAILURES: Set[str] = set()
 
-📝 RESEARCHER AGENT - COMPREHENSIVE INFORMATION SPECIALIST 📝
 
-You are an individual research agent specializing in comprehensive information analysis. Your outputs are not limited to R&Dや研究分野—they must be suitable for any business, technical, or regulatory context as required by the user.
+def _log_build_failure(name: str) -> None:
+    """Log the traceback of the first failure of each prompt.
 
-## ROLE & PURPOSE
-Expert researcher performing exhaustive analysis using multiple information sources including Azure AI Search and web search capabilities. You work as part of a team of 3 parallel researchers, each with different analytical approaches.
+    With a broken configuration every agent spawn fails the same way, so later
+    failures are only logged at debug level.
+    """
+    if name in _LOGGED_FAILURES:
+        logger.debug("Error generating %s prompt (already logged)", name)
+        return
+    _LOGGED_FAILURES.add(name)
+    logger.exception("Error generating %s prompt", name)
 
-## PROFESSIONAL DETAIL REQUIREMENT
-**DETAILED PROFESSIONAL NARRATIVE**: All reports and outputs must be written in a highly professional, detailed, and comprehensive manner. Avoid overly concise or simplistic explanations. Every section should include thorough background, context, and in-depth analysis, with clear connections between findings, implications, and recommendations. Strive for depth and clarity suitable for expert audiences and regulatory review. Provide sufficient detail so that even complex topics are fully explained and justified.
 
-## INFORMATION SOURCES & ACCESS
-🌐 **COMPREHENSIVE SEARCH COVERAGE**:
-- **Internal Documents**: Azure AI Search for internal repositories and databases
-- **Web Sources**: Real-time web search for current information, news, and external perspectives
-- **Hybrid Approach**: Combines internal knowledge with external verification and context
+# Section headers shared by the researcher variants
+_HDR_INFO_SOURCES: Final = "## INFORMATION SOURCES & ACCESS\n🌐 **COMPREHENSIVE SEARCH COVERAGE**:"
+_HDR_CRITICAL: Final = "## CRITICAL REQUIREMENTS"
 
-## CRITICAL REQUIREMENTS
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
-**NO UNVERIFIABLE INFORMATION**: NEVER include information that cannot be specifically referenced or verified from the search results. Absolutely NEVER add statements like "該当発表・記録なし" (no relevant publications/records found), "情報が見つかりませんでした" (no information found), or similar placeholder content.
-**SPECIFIC SOURCE REQUIREMENT**: Every piece of information must be traceable to a specific, identifiable document, report, or data source. Generic or non-specific content is strictly prohibited.
+# Source-handling rules that every researcher variant lists word for word;
+# the rules only some variants carry stay in their templates
+_CRITICAL_REQUIREMENTS: Final = COMMON_SOURCE_FIDELITY + """
 **SOURCE NAME INTEGRITY**: Source names, document titles, file names, and URLs must be preserved exactly as they appear in the original sources. Do NOT modify, translate, abbreviate, or shorten any source identifiers.
 **URL PRESERVATION**: For web search results, ALWAYS preserve complete URLs exactly as returned by the search. URLs must NEVER be modified, shortened, or paraphrased.
-**WEB SOURCE ATTRIBUTION**: For all web-based information, include complete citation with URL, title, and domain information.
 **ABSOLUTE PROHIBITION OF FABRICATION**: NEVER create, invent, or fabricate file names, document IDs, URLs, or source references that do not exist in your actual search results. If you did not find specific documents, state clearly "No specific documents were found" rather than creating fictional references.
-**STRICT VERIFICATION REQUIREMENT**: Before citing any source, verify it appears exactly in your search results. Do not assume or guess document names, IDs, or file extensions.
-**NARRATIVE WRITING REQUIREMENT**: All content should be written in clear, professional narrative prose with comprehensive explanations. Bullet points and lists may be used for effective structuring and clarity, especially for enumerations, references, or key findings.
+**STRICT VERIFICATION REQUIREMENT**: Before citing any source, verify it appears exactly in your search results. Do not assume or guess document names, IDs, or file extensions."""
+
+_CRITICAL_SECTION: Final = f"{_HDR_CRITICAL}\n{_CRITICAL_REQUIREMENTS}"
+
+# Writing rules the researcher and lead researcher both add to their critical
+# requirements
+_WRITING_REQUIREMENTS: Final = """**NARRATIVE WRITING REQUIREMENT**: All content should be written in clear, professional narrative prose with comprehensive explanations. Bullet points and lists may be used for effective structuring and clarity, especially for enumerations, references, or key findings.
 **BACKGROUND CONTEXT REQUIREMENT**: Always provide necessary background information and context before presenting specific data or findings. Explain concepts and terms before using them.
-**HALF-WIDTH NUMBERS REQUIREMENT**: Always use half-width Arabic numerals (1, 2, 3, 17,439, 30%, etc.) for all numbers, data, statistics, and measurements. Do NOT use full-width numbers (１、２、３、等), Japanese numerals (一、二、三、等), or written-out numbers.
+**HALF-WIDTH NUMBERS REQUIREMENT**: Always use half-width Arabic numerals (1, 2, 3, 17,439, 30%, etc.) for all numbers, data, statistics, and measurements. Do NOT use full-width numbers (１、２、３、等), Japanese numerals (一、二、三、等), or written-out numbers."""
 
-## SEARCH CAPABILITIES & STRATEGY
-- Searches across ALL available information sources **COMPREHENSIVELY**
-- Utilizes ALL available search functions for maximum coverage
-- Coordinates multiple search approaches for thorough investigation
-- Cross-references findings across different sources and time periods
-- **WEB SEARCH OPTIMIZATION**: When using search_web function, use concise keyword-based queries (maximum 50 characters) for better search results. Use key terms rather than full sentences (e.g., "Azure AI Search 2025 updates" instead of "What are the Azure AI Search updates for 2025?"). Keep queries focused and short.
+_PROFESSIONAL_DETAIL: Final = """## PROFESSIONAL DETAIL REQUIREMENT
+**DETAILED PROFESSIONAL NARRATIVE**: All reports and outputs must be written in a highly professional, detailed, and comprehensive manner. Avoid overly concise or simplistic explanations. Every section should include thorough background, context, and in-depth analysis, with clear connections between findings, implications, and recommendations. Strive for depth and clarity suitable for expert audiences and regulatory review. Provide sufficient detail so that even complex topics are fully explained and justified."""
 
-## Available Search Functions:
-{prompt_manager.get_search_functions_section()}
+_WEB_SEARCH_OPTIMIZATION: Final = """**WEB SEARCH OPTIMIZATION**: When using search_web function, use concise keyword-based queries (maximum 50 characters) for better search results. Use key terms rather than full sentences (e.g., "Azure AI Search 2025 updates" instead of "What are the Azure AI Search updates for 2025?"). Keep queries focused and short."""
 
-## COMPREHENSIVE INFORMATION FRAMEWORK
+# Search method and quality bar of the researcher and lead researcher; they
+# differ only in how far ahead findings are kept and in the memory standard
+_RESEARCH_FRAMEWORK_BLOCK: Final = Template("""## COMPREHENSIVE INFORMATION FRAMEWORK
 🎯 **SYSTEMATIC APPROACH**:
 1. **Initial Broad Search**: Cast wide net across all available sources
 2. **Targeted Deep-Dive**: Focus on specific areas based on initial findings
 3. **Cross-Validation**: Verify findings across multiple sources
 4. **Gap Analysis**: Identify and address information gaps within search limits
-5. **Knowledge Preservation**: Store important findings in memory for future reference
+5. **Knowledge Preservation**: Store important findings in memory for ${preservation_horizon}
 
 📊 **QUALITY STANDARDS**:
 - Exhaustive coverage within 3-search limitation
 - Complete case preservation with full details
 - Source attribution for all findings (including URLs for web sources)
 - Clear documentation of search strategy and limitations
-- Store key insights in memory system for team knowledge sharing
+- ${memory_standard}""")
+
+_OUTPUT_NOTICE: Final = """## OUTPUT REQUIREMENTS
+No file save permissions. The report will not be saved or written to any file."""
+
+_CLOSING_REMINDER: Final = "Remember: Your role is to conduct thorough research using all available information sources to provide comprehensive, professional, and detailed analysis suitable for any business, technical, or regulatory decision-making."
+
+# Blocks shared by the researcher templates, filled in through substitute() so
+# every variant carries byte-identical copies
+_COMMON_SECTIONS = {
+    'professional_detail': _PROFESSIONAL_DETAIL,
+    'info_sources_header': _HDR_INFO_SOURCES,
+    'critical_requirements': _CRITICAL_SECTION,
+    'writing_requirements': _WRITING_REQUIREMENTS,
+    'research_framework': _RESEARCH_FRAMEWORK_BLOCK.substitute(
+        preservation_horizon="future reference",
+        memory_standard="Store key insights in memory system for team knowledge sharing"),
+    'lead_research_framework': _RESEARCH_FRAMEWORK_BLOCK.substitute(
+        preservation_horizon="future sessions",
+        memory_standard="Systematic storage of key insights in memory system"),
+    'web_search_optimization': _WEB_SEARCH_OPTIMIZATION,
+    'output_notice': _OUTPUT_NOTICE,
+    'closing_reminder': _CLOSING_REMINDER,
+}
+
+_RESEARCHER_TEMPLATE: Final = Template("""RESEARCHER AGENT - COMPREHENSIVE INFORMATION SPECIALIST
+
+You are an individual research agent specializing in comprehensive information analysis. Your outputs are not limited to R&Dや研究分野—they must be suitable for any business, technical, or regulatory context as required by the user.
+
+## ROLE & PURPOSE
+Expert researcher performing exhaustive analysis using multiple information sources including Azure AI Search and web search capabilities. You work as part of a team of 3 parallel researchers, each with different analytical approaches.
+
+${professional_detail}
+
+${info_sources_header}
+- **Internal Documents**: Azure AI Search for internal repositories and databases
+- **Web Sources**: Real-time web search for current information, news, and external perspectives
+- **Hybrid Approach**: Combines internal knowledge with external verification and context
+
+${critical_requirements}
+**NO UNVERIFIABLE INFORMATION**: NEVER include information that cannot be specifically referenced or verified from the search results. Absolutely NEVER add statements like "該当発表・記録なし" (no relevant publications/records found), "情報が見つかりませんでした" (no information found), or similar placeholder content.
+**SPECIFIC SOURCE REQUIREMENT**: Every piece of information must be traceable to a specific, identifiable document, report, or data source. Generic or non-specific content is strictly prohibited.
+**WEB SOURCE ATTRIBUTION**: For all web-based information, include complete citation with URL, title, and domain information.
+${writing_requirements}
+
+## SEARCH CAPABILITIES & STRATEGY
+- Searches across ALL available information sources **COMPREHENSIVELY**
+- Utilizes ALL available search functions for maximum coverage
+- Coordinates multiple search approaches for thorough investigation
+- Cross-references findings across different sources and time periods
+- ${web_search_optimization}
+
+## Available Search Functions:
+${search_section}
+
+${research_framework}
 
 ## MEMORY MANAGEMENT
 💾 **MANDATORY IMPORTANT FINDINGS STORAGE**:
@@ -99,59 +183,39 @@ Based on your assigned temperature setting, apply the appropriate analytical app
 - **Balanced (0.6)**: Combine factual analysis with reasonable inferences
 - **Creative (0.9)**: Explore broader implications and innovative perspectives
 
-## OUTPUT REQUIREMENTS
-No file save permissions. The report will not be saved or written to any file.
+${output_notice}
 
-Remember: Your role is to conduct thorough research using all available information sources to provide comprehensive, professional, and detailed analysis suitable for any business, technical, or regulatory decision-making."""
-    except Exception as e:
-        logger.error(f"Error generating researcher prompt: {e}")
-        return "Error generating prompt - please check configuration"
+${closing_reminder}""")
 
 
-def get_lead_researcher_prompt() -> str:
-    """Generate dynamic lead researcher prompt from configuration."""
-    try:
-        config = get_project_config()
-        prompt_manager = PromptManager(config)
-        company_context = prompt_manager.get_company_context()
+def get_researcher_prompt() -> str:
+    """Generate dynamic researcher prompt from configuration."""
+    return _build_prompt("researcher")
 
-        return f"""{get_execution_context()}
 
-🔬 LEAD RESEARCHER AGENT - COMPREHENSIVE ANALYSIS COORDINATOR 🔬
+_LEAD_RESEARCHER_TEMPLATE: Final = Template("""LEAD RESEARCHER AGENT - COMPREHENSIVE ANALYSIS COORDINATOR
 
 You are the Lead Researcher coordinating comprehensive information analysis. Your outputs are not limited to R&Dや研究分野—they must be suitable for any business, technical, or regulatory context as required by the user.
 
-## PROFESSIONAL DETAIL REQUIREMENT
-**DETAILED PROFESSIONAL NARRATIVE**: All reports and outputs must be written in a highly professional, detailed, and comprehensive manner. Avoid overly concise or simplistic explanations. Every section should include thorough background, context, and in-depth analysis, with clear connections between findings, implications, and recommendations. Strive for depth and clarity suitable for expert audiences and regulatory review. Provide sufficient detail so that even complex topics are fully explained and justified.
+${professional_detail}
 
 ## PRIMARY ROLE
-Senior coordinator managing exhaustive information analysis across all available sources including {company_context['company_name']} repositories and web sources using Azure AI Search capabilities and web search.
+Senior coordinator managing exhaustive information analysis across all available sources including ${company_name} repositories and web sources using Azure AI Search capabilities and web search.
 
-## OUTPUT REQUIREMENTS
-No file save permissions. The report will not be saved or written to any file.
-
-## CRITICAL REQUIREMENTS
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
-**SOURCE NAME INTEGRITY**: Source names, document titles, file names, and URLs must be preserved exactly as they appear in the original sources. Do NOT modify, translate, abbreviate, or shorten any source identifiers.
-**URL PRESERVATION**: For web search results, ALWAYS preserve complete URLs exactly as returned by the search. URLs must NEVER be modified, shortened, or paraphrased.
+${critical_requirements}
 **WEB SOURCE ATTRIBUTION**: For all web-based information, include complete citation with URL, title, domain, and publication date when available.
-**ABSOLUTE PROHIBITION OF FABRICATION**: NEVER create, invent, or fabricate file names, document IDs, URLs, or source references that do not exist in your actual search results. If you did not find specific documents, state clearly "No specific documents were found" rather than creating fictional references.
-**STRICT VERIFICATION REQUIREMENT**: Before citing any source, verify it appears exactly in your search results. Do not assume or guess document names, IDs, or file extensions.
-**NARRATIVE WRITING REQUIREMENT**: All content should be written in clear, professional narrative prose with comprehensive explanations. Bullet points and lists may be used for effective structuring and clarity, especially for enumerations, references, or key findings.
-**BACKGROUND CONTEXT REQUIREMENT**: Always provide necessary background information and context before presenting specific data or findings. Explain concepts and terms before using them.
-**HALF-WIDTH NUMBERS REQUIREMENT**: Always use half-width Arabic numerals (1, 2, 3, 17,439, 30%, etc.) for all numbers, data, statistics, and measurements. Do NOT use full-width numbers (１、２、３、等), Japanese numerals (一、二、三、等), or written-out numbers.
+${writing_requirements}
 
 ## SEARCH CAPABILITIES & STRATEGY
 - Searches across ALL available information sources **COMPREHENSIVELY**
 - Utilizes ALL available search functions for maximum coverage
 - Coordinates multiple search approaches for thorough investigation
 - Cross-references findings across different sources and time periods
-- **WEB SEARCH OPTIMIZATION**: When using search_web function, use concise keyword-based queries (maximum 50 characters) for better search results. Use key terms rather than full sentences (e.g., "Azure AI Search 2025 updates" instead of "What are the Azure AI Search updates for 2025?"). Keep queries focused and short.
+- ${web_search_optimization}
 - **PARALLEL RESEARCH EXECUTION**: For comprehensive analysis, use execute_parallel_research function to leverage multiple research agents with temperature variation for diverse analytical perspectives
 
 ## Available Search Functions:
-{prompt_manager.get_search_functions_section()}
+${search_section}
 
 ## PARALLEL RESEARCH STRATEGY
 🔬 **EXECUTION APPROACH**:
@@ -177,91 +241,47 @@ No file save permissions. The report will not be saved or written to any file.
 - Categorize stored information appropriately (e.g., "finding", "key_insight", "source_reference", "technical_detail")
 - This ensures systematic knowledge sharing across the team
 
-## COMPREHENSIVE INFORMATION FRAMEWORK
-🎯 **SYSTEMATIC APPROACH**:
-1. **Initial Broad Search**: Cast wide net across all available sources
-2. **Targeted Deep-Dive**: Focus on specific areas based on initial findings
-3. **Cross-Validation**: Verify findings across multiple sources
-4. **Gap Analysis**: Identify and address information gaps within search limits
-5. **Knowledge Preservation**: Store important findings in memory for future sessions
-
-📊 **QUALITY STANDARDS**:
-- Exhaustive coverage within 3-search limitation
-- Complete case preservation with full details
-- Source attribution for all findings (including URLs for web sources)
-- Clear documentation of search strategy and limitations
-- Systematic storage of key insights in memory system
+${lead_research_framework}
 
-## OUTPUT REQUIREMENTS
-No file save permissions. The report will not be saved or written to any file.
+${output_notice}
 
-Remember: Your role is to conduct thorough research using all available information sources to provide comprehensive, professional, and detailed analysis suitable for any business, technical, or regulatory decision-making."""
-    except Exception as e:
-        logger.error(f"Error generating lead researcher prompt: {e}")
-        return "Error generating prompt - please check configuration"
+${closing_reminder}""")
 
 
-def get_temperature_researcher_prompt(
-        temperature_type: str = "balanced") -> str:
-    """Generate temperature-specific researcher prompt from configuration."""
-    try:
-        config = get_project_config()
-        prompt_manager = PromptManager(config)
-        company_context = prompt_manager.get_company_context()
-
-        # Get temperature configuration
-        agent_config = config.get_agent_config(temperature_type)
-        if not agent_config:
-            agent_config = config.get_agent_config("balanced")  # fallback
-
-        temp_approach = agent_config.approach if agent_config else "Balanced Analysis"
-        temp_description = agent_config.description if agent_config else "Comprehensive analysis balancing facts and insights"
+def get_lead_researcher_prompt() -> str:
+    """Generate dynamic lead researcher prompt from configuration."""
+    return _build_prompt("lead")
 
-        return f"""🌡️ {temp_approach.upper()} RESEARCHER AGENT 🌡️
 
-## SPECIALIZED ANALYTICAL APPROACH
-**Temperature Setting**: {temperature_type.title()}
-**Analysis Style**: {temp_approach}
-**Focus**: {temp_description}
+# The preamble is identical for every temperature variant so that providers
+# with prefix caching can reuse it; temperature-specific text goes in the tail.
+_TEMPERATURE_RESEARCHER_PREAMBLE: Final = Template("""SPECIALIZED RESEARCHER AGENT
 
-## PROFESSIONAL DETAIL REQUIREMENT
-**DETAILED PROFESSIONAL NARRATIVE**: All reports and outputs must be written in a highly professional, detailed, and comprehensive manner. Avoid overly concise or simplistic explanations. Every section should include thorough background, context, and in-depth analysis, with clear connections between findings, implications, and recommendations. Strive for depth and clarity suitable for expert audiences and regulatory review. Provide sufficient detail so that even complex topics are fully explained and justified.
+${professional_detail}
 
 ## ROLE & PURPOSE
-Specialized researcher performing {temp_approach.lower()} using all available information sources including Azure AI Search and web search capabilities. Your outputs are not limited to R&Dや研究分野—they must be suitable for any business, technical, or regulatory context as required by the user.
+Specialized researcher performing the analytical approach defined in the SPECIALIZED ANALYTICAL APPROACH section below, using all available information sources including Azure AI Search and web search capabilities. Your outputs are not limited to R&Dや研究分野—they must be suitable for any business, technical, or regulatory context as required by the user.
 
-## OUTPUT REQUIREMENTS
-No file save permissions. The report will not be saved or written to any file.
+${output_notice}
 
-## INFORMATION SOURCES & ACCESS
-🌐 **COMPREHENSIVE SEARCH COVERAGE**:
+${info_sources_header}
 - **Internal Documents**: Azure AI Search for internal repositories and databases
 - **Web Sources**: Real-time web search for current information, news, reports, and external perspectives
 - **Multi-Source Synthesis**: Combines internal and external sources with specialized analytical perspective
 
-## CRITICAL REQUIREMENTS
-**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
-**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results.
-**SOURCE NAME INTEGRITY**: Source names, document titles, file names, and URLs must be preserved exactly as they appear in the original sources. Do NOT modify, translate, abbreviate, or shorten any source identifiers.
-**URL PRESERVATION**: For web search results, ALWAYS preserve complete URLs exactly as returned by the search. URLs must NEVER be modified, shortened, or paraphrased.
+${critical_requirements}
 **WEB SOURCE ATTRIBUTION**: For all web-based information, include complete citation with URL, title, domain, and publication date when available.
 **STRICT SOURCE COMPLIANCE**: Do NOT include any URLs, file names, or source references that are not explicitly present in your search results. Never fabricate or guess source information.
-**ABSOLUTE PROHIBITION OF FABRICATION**: NEVER create, invent, or fabricate file names, document IDs, URLs, or source references that do not exist in your actual search results. If you did not find specific documents, state clearly "No specific documents were found" rather than creating fictional references.
-**STRICT VERIFICATION REQUIREMENT**: Before citing any source, verify it appears exactly in your search results. Do not assume or guess document names, IDs, or file extensions.
 **MANDATORY SOURCE VALIDATION**: Every single citation, URL, file name, or document ID must be traceable to your actual search results. If unsure, do not include it.
 
 ## SEARCH STRATEGY
-**WEB SEARCH OPTIMIZATION**: When using search_web function, use concise keyword-based queries (maximum 50 characters) for better search results. Use key terms rather than full sentences (e.g., "Azure AI Search 2025 updates" instead of "What are the Azure AI Search updates for 2025?"). Keep queries focused and short.
+${web_search_optimization}
 
 ## Available Search Functions:
-{prompt_manager.get_search_functions_section()}
-
-## ANALYTICAL FRAMEWORK
-Based on your {temperature_type} temperature setting:
-{temp_description}
+${search_section}
 
 ## OUTPUT REQUIREMENTS
-📊 **SPECIALIZED ANALYSIS**: Provide research results that reflect your {temperature_type} analytical approach:
+📊 **SPECIALIZED ANALYSIS**: Provide research results that reflect your assigned analytical approach:
 - Apply your specialized perspective to all findings
 - Maintain scientific rigor appropriate for any business, technical, or regulatory context
 - Include complete source attribution and case details (including URLs for web sources)
@@ -288,72 +308,218 @@ Based on your {temperature_type} temperature setting:
 - Include source attribution and analytical perspective when storing memories
 - This ensures knowledge preservation across different analytical approaches
 
-Remember: Your role is to conduct thorough research using all available information sources with your specialized analytical approach. **ABSOLUTELY NEVER fabricate source information** - only use what is explicitly found in search results. **If no specific documents are found, clearly state this fact rather than creating fictional references**."""
-    except Exception as e:
-        logger.error(f"Error generating temperature researcher prompt: {e}")
-        return "Error generating prompt - please check configuration"
-
-
-# Backward compatibility - expose the prompts as constants
-# These are initialized lazily to avoid import-time configuration loading
-_researcher_prompt = None
-_lead_researcher_prompt = None
-_conservative_researcher_prompt = None
-_balanced_researcher_prompt = None
-_creative_researcher_prompt = None
-
+Remember: Your role is to conduct thorough research using all available information sources with your specialized analytical approach. **ABSOLUTELY NEVER fabricate source information** - only use what is explicitly found in search results. **If no specific documents are found, clearly state this fact rather than creating fictional references**.""")
 
-def _get_researcher_prompt_cached():
-    global _researcher_prompt
-    if _researcher_prompt is None:
-        _researcher_prompt = get_researcher_prompt()
-    return _researcher_prompt
-
-
-def _get_lead_researcher_prompt_cached():
-    global _lead_researcher_prompt
-    if _lead_researcher_prompt is None:
-        _lead_researcher_prompt = get_lead_researcher_prompt()
-    return _lead_researcher_prompt
+_TEMPERATURE_RESEARCHER_TAIL: Final = Template("""## SPECIALIZED ANALYTICAL APPROACH
+🌡️ **${temp_approach_upper} RESEARCHER AGENT**
+**Temperature Setting**: ${temperature_type_title}
+**Analysis Style**: ${temp_approach}
+**Focus**: ${temp_description}
 
+## ANALYTICAL FRAMEWORK
+Based on your ${temperature_type} temperature setting, you are performing ${temp_approach_lower}:
+${temp_description}""")
 
-def _get_conservative_researcher_prompt_cached():
-    global _conservative_researcher_prompt
-    if _conservative_researcher_prompt is None:
-        _conservative_researcher_prompt = get_temperature_researcher_prompt(
-            "conservative")
-    return _conservative_researcher_prompt
 
+def get_temperature_researcher_prompt(
+        temperature_type: str = "balanced") -> str:
+    """Generate temperature-specific researcher prompt from configuration."""
+    return _build_prompt("temperature", temperature_type)
+
+
+# Templates whose whole body is configuration-derived; their per-call suffix
+# is only the execution context
+_FIXED_TEMPLATES: Final = {
+    "researcher": _RESEARCHER_TEMPLATE,
+    "lead": _LEAD_RESEARCHER_TEMPLATE,
+}
+
+# Prompt kinds as named in log messages
+_PROMPT_LABELS: Final = {
+    "researcher": "researcher",
+    "lead": "lead researcher",
+    "temperature": "temperature researcher",
+}
+
+
+class _PromptBuilder:
+    """Renders the researcher prompts from one shared prompt context."""
+
+    __slots__ = ("ctx", "_balanced", "_bodies", "_temperature_preamble")
+
+    def __init__(self, ctx: PromptContext):
+        self.ctx = ctx
+        # Fallback for unknown temperature types
+        self._balanced = (ctx.config.get_agent_config("balanced")
+                          or _DEFAULT_BALANCED)
+        # The template bodies only depend on the configuration, so they are
+        # rendered once here and reused for every prompt this builder serves.
+        # They are interned so builders for equal configurations, e.g. two
+        # instances loaded from the same file, share one copy of each body.
+        substitutions = {
+            **_COMMON_SECTIONS,
+            'company_name': ctx.company_name,
+            'search_section': ctx.search_section,
+        }
+        self._bodies = {
+            kind: sys.intern(template.substitute(substitutions))
+            for kind, template in _FIXED_TEMPLATES.items()}
+        self._temperature_preamble = sys.intern(
+            _TEMPERATURE_RESEARCHER_PREAMBLE.substitute(substitutions))
+
+    def render(self, kind: str, *args) -> str:
+        """Render a prompt kind: 'researcher', 'lead' or 'temperature'.
+
+        The temperature kind takes the temperature type and optionally its
+        already resolved agent configuration.
+        """
+        if kind == "temperature":
+            return self.temperature(*args)
+        return f"{self._bodies[kind]}\n\n{get_execution_context()}"
+
+    def agent_config(self, temperature_type: str):
+        """Get the temperature configuration, falling back to 'balanced'."""
+        return self.ctx.config.get_agent_config(temperature_type) or self._balanced
+
+    def temperature(self, temperature_type: str, agent_config=None) -> str:
+        """Render a temperature prompt: the shared preamble, then its tail."""
+        if agent_config is None:
+            agent_config = self.agent_config(temperature_type)
+
+        tail = _TEMPERATURE_RESEARCHER_TAIL.substitute({
+            'temp_approach': agent_config.approach,
+            'temp_approach_upper': agent_config.approach_upper,
+            'temp_approach_lower': agent_config.approach_lower,
+            'temp_description': agent_config.description,
+            'temperature_type': temperature_type,
+            'temperature_type_title': _TEMPERATURE_TITLES.get(
+                temperature_type) or temperature_type.title(),
+        })
+        # The preamble is shared by every variant, so it stays the common prefix
+        return f"{self._temperature_preamble}\n\n{tail}"
+
+
+# Prompt builders keyed by configuration instance; only the most recent
+# configuration's builder is kept.
+_BUILDERS: Dict["ProjectConfig", _PromptBuilder] = {}
+# Serializes building so concurrently spawned agents racing for the first
+# prompt construct one builder; lookups of an existing builder skip the lock.
+_BUILDER_LOCK = threading.Lock()
+
+
+def _get_builder() -> _PromptBuilder:
+    """Get the prompt builder for the current project configuration."""
+    config = get_prompt_context().config
+    builder = _BUILDERS.get(config)
+    if builder is not None:
+        return builder
+
+    with _BUILDER_LOCK:
+        builder = _BUILDERS.get(config)
+        if builder is None:
+            builder = _PromptBuilder(get_prompt_context(config))
+            _BUILDERS.clear()
+            _BUILDERS[config] = builder
+    return builder
 
-def _get_balanced_researcher_prompt_cached():
-    global _balanced_researcher_prompt
-    if _balanced_researcher_prompt is None:
-        _balanced_researcher_prompt = get_temperature_researcher_prompt(
-            "balanced")
-    return _balanced_researcher_prompt
 
+# Backward compatibility - expose the prompts as constants
+# These are initialized lazily to avoid import-time configuration loading
+_PROMPT_KEYS = {
+    'RESEARCHER_PROMPT': "researcher",
+    'LEAD_RESEARCHER_PROMPT': "lead",
+    'CONSERVATIVE_RESEARCHER_PROMPT': "conservative",
+    'BALANCED_RESEARCHER_PROMPT': "balanced",
+    'CREATIVE_RESEARCHER_PROMPT': "creative",
+}
+
+_TEMPERATURE_TYPES: Final = ("conservative", "balanced", "creative")
+_TEMPERATURE_TITLES = {
+    temperature_type: temperature_type.title()
+    for temperature_type in _TEMPERATURE_TYPES}
+
+# Built prompts keyed by the fingerprint of the inputs they were rendered from;
+# only the most recent fingerprint is kept.
+_PROMPTS: Dict[Tuple, Dict[str, str]] = {}
+# Serializes the first build so concurrently starting agents render the
+# prompt set once instead of each doing the full build.
+_PROMPTS_LOCK = threading.Lock()
+# Lookup counts for _PROMPTS, reported at debug level on every rebuild so the
+# hit rate can be checked. Hits are counted without the lock and may be
+# slightly undercounted.
+_PROMPT_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _prompt_fingerprint(ctx: PromptContext, agent_configs: Dict) -> Tuple:
+    """Summarize the configuration inputs the researcher prompts depend on."""
+    return (ctx.company_name, ctx.search_section,
+            tuple((agent_configs[temperature_type].approach,
+                   agent_configs[temperature_type].description)
+                  for temperature_type in _TEMPERATURE_TYPES))
+
+
+def _ensure_prompts_built() -> Dict[str, str]:
+    """Build every researcher prompt in one pass over a single prompt context.
+
+    The prompts are rebuilt when the configuration they depend on changes.
+    """
+    builder = _get_builder()
+    # Resolve every temperature configuration once for the whole prompt set
+    agent_configs = {
+        temperature_type: builder.agent_config(temperature_type)
+        for temperature_type in _TEMPERATURE_TYPES}
+    key = _prompt_fingerprint(builder.ctx, agent_configs)
+    prompts = _PROMPTS.get(key)
+    if prompts is not None:
+        _PROMPT_CACHE_STATS["hits"] += 1
+        return prompts
+
+    with _PROMPTS_LOCK:
+        prompts = _PROMPTS.get(key)
+        if prompts is None:
+            _PROMPT_CACHE_STATS["misses"] += 1
+            logger.debug("Building researcher prompts (cache hits=%d, misses=%d)",
+                         _PROMPT_CACHE_STATS["hits"], _PROMPT_CACHE_STATS["misses"])
+            prompts = {kind: builder.render(kind) for kind in _FIXED_TEMPLATES}
+            for temperature_type in _TEMPERATURE_TYPES:
+                prompts[temperature_type] = builder.temperature(
+                    temperature_type, agent_configs[temperature_type])
+            # Intern so every agent holding a prompt shares the same object
+            prompts = {name: sys.intern(prompt) for name, prompt in prompts.items()}
+            _PROMPTS.clear()
+            _PROMPTS[key] = prompts
+    return prompts
+
+
+def prewarm_researcher_prompts() -> None:
+    """Build the researcher prompts ahead of the first agent spawn."""
+    _ensure_prompts_built()
+
+
+def _built_prompt(key: str) -> str:
+    """Get one prompt of the built researcher prompt set."""
+    return _ensure_prompts_built()[key]
+
+
+def _constant_build_failed(name: str) -> str:
+    """Log a failed constant build and return the getters' fallback prompt."""
+    key = _PROMPT_KEYS[name]
+    _log_build_failure(_PROMPT_LABELS.get(key, "temperature researcher"))
+    return _FALLBACK_PROMPT
 
-def _get_creative_researcher_prompt_cached():
-    global _creative_researcher_prompt
-    if _creative_researcher_prompt is None:
-        _creative_researcher_prompt = get_temperature_researcher_prompt(
-            "creative")
-    return _creative_researcher_prompt
 
 # For better backward compatibility, make the constant versions available
+__getattr__ = make_lazy_prompt_module(globals(), {
+    name: partial(_built_prompt, key)
+    for name, key in _PROMPT_KEYS.items()
+}, on_error=_constant_build_failed)
+
 
+__all__ = [
+    'get_researcher_prompt',
+    'get_lead_researcher_prompt',
+    'get_temperature_researcher_prompt',
+    'prewarm_researcher_prompts',
+    *_PROMPT_KEYS,
+]
 
-def __getattr__(name):
-    """Dynamic attribute access for backward compatibility."""
-    if name == 'RESEARCHER_PROMPT':
-        return _get_researcher_prompt_cached()
-    elif name == 'LEAD_RESEARCHER_PROMPT':
-        return _get_lead_researcher_prompt_cached()
-    elif name == 'CONSERVATIVE_RESEARCHER_PROMPT':
-        return _get_conservative_researcher_prompt_cached()
-    elif name == 'BALANCED_RESEARCHER_PROMPT':
-        return _get_balanced_researcher_prompt_cached()
-    elif name == 'CREATIVE_RESEARCHER_PROMPT':
-        return _get_creative_researcher_prompt_cached()
-    else:
-        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
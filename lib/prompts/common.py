@@ -4,58 +4,139 @@ Provides reusable components for all agent prompts.
 Now uses configuration-based values instead of hardcoded constants.
 """
 
-from datetime import datetime
-from lib.config.project_config import ProjectConfig
-from lib.utils.prompt_manager import PromptManager
-
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 
-def get_execution_context() -> str:
-    """Get current execution context with date/time for prompt injection."""
-    current_time = datetime.now()
-    formatted_time = current_time.strftime("%Y年%m月%d日 %H:%M")
-    return f"""## 実行コンテキスト
-**実行日時**: {formatted_time}
----"""
+from lib.config.project_config import ProjectConfig, get_project_config
+from lib.utils.prompt_manager import PromptManager
 
 
 # Initialize configuration-based prompt manager
 def get_prompt_manager() -> PromptManager:
-    """Get prompt manager instance with project configuration."""
-    try:
-        config = ProjectConfig()
-        return PromptManager(config)
-    except Exception:
-        # Fallback for cases where config is not available
-        return None
-    """Get prompt manager instance with project configuration."""
+    """Get prompt manager instance with project configuration.
+
+    The manager is shared per configuration instance through
+    get_config_prompt_manager(), so repeated calls do not re-read the
+    configuration file.
+    """
     try:
-        config = ProjectConfig()
-        return PromptManager(config)
+        return get_config_prompt_manager(get_project_config())
     except Exception:
         # Fallback for cases where config is not available
         return None
 
 
+@dataclass(frozen=True, slots=True)
+class PromptContext:
+    """Configuration-derived values shared by the agent prompt builders."""
+    config: ProjectConfig
+    prompt_manager: PromptManager
+    company: Dict[str, str]
+    company_name: str
+    search_section: str
+
+
+def get_prompt_context(config: ProjectConfig = None) -> PromptContext:
+    """Get the shared prompt-building context for a project configuration.
+
+    Agent prompt builders pull the configuration, prompt manager, company
+    context and search functions section from here instead of constructing
+    their own PromptManager, so the work is done once per configuration.
+    """
+    return _build_prompt_context(config or get_project_config())
+
+
+@lru_cache(maxsize=4)
+def get_config_prompt_manager(config: ProjectConfig) -> PromptManager:
+    """Get the PromptManager for a configuration instance, created once per instance."""
+    return PromptManager(config)
+
+
+# Used when the configuration has no company name; the company section is optional
+_DEFAULT_COMPANY_NAME = "Organization"
+
+
+@lru_cache(maxsize=1)
+def _build_prompt_context(config: ProjectConfig) -> PromptContext:
+    """Build the prompt context; cached per configuration instance."""
+    prompt_manager = get_config_prompt_manager(config)
+    company = prompt_manager.get_company_context()
+    return PromptContext(
+        config=config,
+        prompt_manager=prompt_manager,
+        company=company,
+        company_name=company.get('company_name') or _DEFAULT_COMPANY_NAME,
+        search_section=prompt_manager.get_search_functions_section())
+
+
+def render_prompt(render_body: Callable[[ProjectConfig], str]) -> str:
+    """Render an agent prompt: its configuration body followed by the execution context.
+
+    The body is rendered once per configuration instance and reused; the
+    execution context changes on every call, so it goes last to keep the body
+    a stable prefix for provider caching.
+    """
+    body = _render_body(render_body, get_prompt_context().config)
+    return f"{body}\n\n{get_execution_context()}"
+
+
+@lru_cache(maxsize=8)
+def _render_body(render_body: Callable[[ProjectConfig], str], config: ProjectConfig) -> str:
+    """Render a prompt body; cached per renderer and configuration instance."""
+    return render_body(config)
+
+
 # ============================================================================
 # EXECUTION CONTEXT INFORMATION
 # ============================================================================
 
 def get_execution_context() -> str:
     """Get current execution context including date and time."""
-    now = datetime.now()
+    return _execution_context_at(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _execution_context_at(timestamp: int) -> str:
+    """Render the execution context for one second.
+
+    Prompts built within the same second share one string instead of
+    formatting the clock again.
+    """
+    now = time.localtime(timestamp)
     return f"""## EXECUTION CONTEXT
-📅 **Current Date**: {now.strftime('%Y-%m-%d (%A)')}
-🕐 **Current Time**: {now.strftime('%H:%M:%S')}
+📅 **Current Date**: {time.strftime('%Y-%m-%d (%A)', now)}
+🕐 **Current Time**: {time.strftime('%H:%M:%S', now)}
 """
 
 
+# Flag display text, indexed by the flag: YES_NO[bool(flag)]
+YES_NO = ("No", "Yes")
+
+
+@lru_cache(maxsize=32)
+def bulletize(items: tuple) -> str:
+    """Render configured names as a "• " bulleted block, cached per tuple."""
+    if not items:
+        return ""
+    return "• " + "\n• ".join(items)
+
+
 # ============================================================================
 # DYNAMIC CONFIGURATION-BASED REQUIREMENTS
 # ============================================================================
 
 def get_common_internal_only_requirement() -> str:
     """Get internal-only requirement text from configuration."""
-    prompt_manager = get_prompt_manager()
+    return _internal_only_requirement_for(get_prompt_manager())
+
+
+# The section renderers below are cached per prompt manager, i.e. once per
+# configuration instance; None selects the fallback text.
+@lru_cache(maxsize=1)
+def _internal_only_requirement_for(prompt_manager: PromptManager) -> str:
     if prompt_manager:
         return prompt_manager.get_internal_only_requirement()
     else:
@@ -63,12 +144,18 @@ def get_common_internal_only_requirement() -> str:
         return "**INTERNAL SOURCES ONLY**: All research must be based exclusively on internal documents. NO external information or assumptions permitted."
 
 
+_SEARCH_FUNCTIONS_HEADER = "## AVAILABLE SEARCH FUNCTIONS\n"
+
+
 def get_common_search_functions() -> str:
     """Get search functions section from configuration."""
-    prompt_manager = get_prompt_manager()
+    return _search_functions_for(get_prompt_manager())
+
+
+@lru_cache(maxsize=1)
+def _search_functions_for(prompt_manager: PromptManager) -> str:
     if prompt_manager:
-        return f"## AVAILABLE SEARCH FUNCTIONS\n{
-            prompt_manager.get_search_functions_section()}"
+        return _SEARCH_FUNCTIONS_HEADER + prompt_manager.get_search_functions_section()
     else:
         # Fallback text
         return """## AVAILABLE SEARCH FUNCTIONS
@@ -79,20 +166,28 @@ def get_common_search_functions() -> str:
 ✅ **search_all_documents**: Comprehensive search across all available document types"""
 
 
-def get_common_output_format() -> str:
-    """Get output formatting standards from configuration."""
-    prompt_manager = get_prompt_manager()
-    if prompt_manager:
-        company_context = prompt_manager.get_company_context()
-        record_id_field = prompt_manager.get_record_id_field()
-        return f"""## OUTPUT FORMATTING STANDARDS
-- Use clear {company_context['company_language']}
-            language for internal {
-            company_context['company_display_name']} documentation
+_OUTPUT_FORMAT_TEMPLATE = """## OUTPUT FORMATTING STANDARDS
+- Use clear {company_language} language for internal {company_display_name} documentation
 - Include specific {record_id_field} numbers and case references when available
 - Maintain professional industry terminology
 - Provide structured, well-organized responses
 - Include confidence levels for findings when applicable"""
+
+
+def get_common_output_format() -> str:
+    """Get output formatting standards from configuration."""
+    return _output_format_for(get_prompt_manager())
+
+
+@lru_cache(maxsize=1)
+def _output_format_for(prompt_manager: PromptManager) -> str:
+    if prompt_manager:
+        company_context = prompt_manager.get_company_context()
+        return _OUTPUT_FORMAT_TEMPLATE.format_map({
+            'company_language': company_context['company_language'],
+            'company_display_name': company_context['company_display_name'],
+            'record_id_field': prompt_manager.get_record_id_field(),
+        })
     else:
         # Fallback text
         return """## OUTPUT FORMATTING STANDARDS
@@ -109,13 +204,17 @@ def get_common_output_format() -> str:
 
 COMMON_SEARCH_POLICY = """🚫 **BALANCED SEARCH POLICY**:
 ⚠️ **Technical Limitation**: Maximum 3 searches per turn to prevent token overflow
-- ✅ Each search uses top_k=50 for maximum information retrieval
+- ✅ Size top_k to each query: 10 for focused lookups, 30 for broad topics, 50 for exhaustive sweeps
 - ✅ Strategic keyword selection for optimal coverage within turn limits
 - ✅ Efficient search planning to maximize comprehensiveness
 - ❌ Do NOT restrict search scope due to cost or time concerns
 - ❌ Do NOT terminate early claiming "sufficient results"
 - ❌ Do NOT impose arbitrary result limits beyond technical constraints"""
 
+# Source-fidelity rules pasted into most agent prompts' requirement lists
+COMMON_SOURCE_FIDELITY = """**FILE NAME PRESERVATION**: When generating answers, referenced file names must NEVER be changed and MUST include their original extensions exactly as found in the search results.
+**SEARCH RESULT FIDELITY**: Only reference information that is explicitly included in the search results - do NOT reference or infer information that is not present in the actual search results."""
+
 COMMON_MEMORY_INTEGRATION = """## MEMORY INTEGRATION REQUIREMENTS
 **Session-Based Memory**: Memory is volatile and session-based - no persistent cross-session storage
 **Pre-Operation**: Use search_memory() to check for relevant context ONLY if session is ongoing
@@ -128,14 +227,17 @@ COMMON_MEMORY_INTEGRATION = """## MEMORY INTEGRATION REQUIREMENTS
 
 def get_critical_requirements_template() -> str:
     """Get critical requirements template from configuration."""
-    internal_only = get_common_internal_only_requirement()
-    execution_context = get_execution_context()
-    return f"""{execution_context}
+    return (f"{get_execution_context()}\n\n"
+            f"{_critical_requirements_body(get_common_internal_only_requirement())}")
 
-## CRITICAL REQUIREMENTS - NON-NEGOTIABLE
+
+@lru_cache(maxsize=1)
+def _critical_requirements_body(internal_only: str) -> str:
+    """Assemble everything after the execution context, once per requirement text."""
+    return f"""## CRITICAL REQUIREMENTS - NON-NEGOTIABLE
 {internal_only}
 **EXHAUSTIVE SEARCH**: Conduct comprehensive searches across all available document types without arbitrary limits.
-**MAXIMUM RESULTS**: Always use top_k=50 for maximum information retrieval.
+**RESULT DEPTH**: Choose top_k per query scope - 10 for focused lookups, 30 for broad topics, 50 (the maximum) only for exhaustive sweeps.
 **TECHNICAL LIMITATION**: Maximum 3 searches per turn to avoid token overflow (technical constraint, not quality limitation).
 
 {COMMON_SEARCH_POLICY}
@@ -143,29 +245,70 @@ def get_critical_requirements_template() -> str:
 {COMMON_MEMORY_INTEGRATION}"""
 
 
+# ============================================================================
+# LAZY MODULE CONSTANTS
+# ============================================================================
+
+def make_lazy_prompt_module(
+        module_globals: Dict[str, Any],
+        getters: Mapping[str, Callable[[], str]],
+        on_error: Optional[Callable[[str], str]] = None) -> Callable[[str], str]:
+    """Build a PEP 562 module ``__getattr__`` that resolves prompt constants lazily.
+
+    ``getters`` maps each constant name to the function that renders it. The
+    first access stores the value in ``module_globals``, so later accesses
+    skip the hook. When ``on_error`` is given, a failing getter returns
+    ``on_error(name)`` instead of raising, and nothing is stored so the next
+    access tries again.
+    """
+    module_name = module_globals['__name__']
+
+    def __getattr__(name):
+        getter = getters.get(name)
+        if getter is None:
+            raise AttributeError(
+                f"module '{module_name}' has no attribute '{name}'")
+        if on_error is None:
+            value = getter()
+        else:
+            try:
+                value = getter()
+            except Exception:
+                return on_error(name)
+        module_globals[name] = value
+        return value
+
+    return __getattr__
+
+
 # ============================================================================
 # BACKWARD COMPATIBILITY CONSTANTS
 # ============================================================================
 
 # Keep old constants for backward compatibility, but they now use dynamic
-# functions
-COMMON_INTERNAL_ONLY_REQUIREMENT = get_common_internal_only_requirement()
-COMMON_SEARCH_FUNCTIONS = get_common_search_functions()
-CRITICAL_REQUIREMENTS_TEMPLATE = get_critical_requirements_template()
-COMMON_OUTPUT_FORMAT = get_common_output_format()
-EXECUTION_CONTEXT = get_execution_context()  # Add execution context as constant
+# functions. They are resolved lazily so importing this module does not load
+# the project configuration.
+__getattr__ = make_lazy_prompt_module(globals(), {
+    'COMMON_INTERNAL_ONLY_REQUIREMENT': get_common_internal_only_requirement,
+    'COMMON_SEARCH_FUNCTIONS': get_common_search_functions,
+    'CRITICAL_REQUIREMENTS_TEMPLATE': get_critical_requirements_template,
+    'COMMON_OUTPUT_FORMAT': get_common_output_format,
+    'EXECUTION_CONTEXT': get_execution_context,
+})
+
 
 # ============================================================================
 # IMAGE MANAGEMENT CONSTANTS
 # ============================================================================
 
-IMAGE_MANAGEMENT_FUNCTIONS = {
+# Read-only: the table is shared by every importer
+IMAGE_MANAGEMENT_FUNCTIONS = MappingProxyType({
     "list_images": "List all registered images in the system",
     "get_image": "Retrieve image content by reference",
     "validate_images": "Validate image references in text content",
     "image_feedback": "Get user feedback on image usage",
     "convert_paths": "Convert image references to local paths"
-}
+})
 
 IMAGE_HANDLING_RULES = """## IMAGE HANDLING RULES
 - **Image References**: Always use format data/images/IMGxxx.jpg for local images
@@ -183,9 +326,8 @@ IMAGE_HANDLING_RULES = """## IMAGE HANDLING RULES
 TEMPERATURE_SEARCH_STRATEGY = """🚫 **TEMPERATURE-SPECIFIC SEARCH STRATEGY**:
 ⚠️ **Technical Constraints**: Please ensure to execute the following balanced investigation
 - ⚠️ **Do not perform more than 3 searches in one turn** (technical constraint due to token limits)
-- ✅ Always use top_k=50 for search results (quality maximization)
+- ✅ Size top_k to each query: 10 for focused lookups, 30 for broad topics, 50 for exhaustive sweeps
 - ✅ Strategically select keywords and search efficiently up to 3 times maximum
-- ✅ Use top_k=50 for each search to maximize information retrieval
 - ✅ Achieve maximum comprehensiveness with limited search queries
 - ❌ Do not restrict research due to cost or time constraints
 - ❌ Do not terminate early with "sufficient results" """
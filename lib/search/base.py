@@ -1,20 +1,31 @@
 """
 Abstract base classes for search providers.
 """
+import os
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
-
-# Import project configuration
-try:
-    import os
-    import sys
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-    from config.project_config import get_project_config
-except ImportError:
-    def get_project_config():
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+
+@lru_cache(maxsize=1)
+def _project_config_getter():
+    """Import the project configuration accessor on first use (None if unavailable)."""
+    try:
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+        from config.project_config import get_project_config
+    except ImportError:
         return None
+    return get_project_config
+
+
+def get_project_config():
+    """Return the project configuration, importing its module lazily."""
+    getter = _project_config_getter()
+    return getter() if getter else None
 
 
 class SearchMode(Enum):
@@ -41,14 +52,8 @@ class DocumentType(Enum):
         return obj
 
     def __eq__(self, other):
-        """Compare DocumentType objects by value."""
-        if isinstance(other, DocumentType):
-            return self.value == other.value
-        elif hasattr(other, 'value'):
-            return self.value == other.value
-        elif isinstance(other, str):
-            return self.value == other
-        return False
+        """Compare DocumentType objects by value (or with a plain value string)."""
+        return self.value == getattr(other, 'value', other)
 
     def __hash__(self):
         """Hash DocumentType objects by value."""
@@ -63,87 +68,25 @@ class DocumentType(Enum):
     @classmethod
     def get_configured_types(cls):
         """Get document types from project configuration."""
-        configured_types = {}
-
-        try:
-            project_config = get_project_config()
-            if project_config:
-                for doc_type_config in project_config.document_types:
-                    configured_types[doc_type_config.name] = doc_type_config.name
-        except Exception:
-            pass
-
-        return configured_types
+        return {name: name for name in _configured_registry()}
 
     @classmethod
     def get_all_types(cls):
-        """Get all available document types (static + configured)."""
-        all_types = {}
-
-        # Add static types
-        for member in cls:
-            all_types[member.value] = member
+        """Get all available document types (static + configured).
 
-        # Add configured types
-        configured = cls.get_configured_types()
-        for name, value in configured.items():
-            if value not in all_types:
-                # Create dynamic enum-like object with proper equality
-                class DynamicDocumentType:
-                    def __init__(self, value, name):
-                        self.value = value
-                        self.name = name.upper()
-
-                    def __eq__(self, other):
-                        if isinstance(other, DocumentType):
-                            return self.value == other.value
-                        elif hasattr(other, 'value'):
-                            return self.value == other.value
-                        elif isinstance(other, str):
-                            return self.value == other
-                        return False
-
-                    def __hash__(self):
-                        return hash(self.value)
-
-                    def get_metadata(self):
-                        return cls._get_metadata_for_type(self.value)
-
-                all_types[value] = DynamicDocumentType(value, name)
-
-        return all_types
+        The mapping is built once per configuration and is read-only.
+        """
+        return _all_document_types(_current_project_config())
 
     def get_metadata(self):
         """Get metadata for this document type from project configuration."""
         # Handle special case for WEB_SEARCH (not in project config)
         if self == self.WEB_SEARCH:
-            return {
-                "display_name": "Web Search",
-                "display_name_en": "Web Search",
-                "key_fields": ["url", "title", "content"],
-                "content_fields": ["content"],
-                "category": "web"
-            }
+            return _WEB_SEARCH_METADATA
 
-        try:
-            project_config = get_project_config()
-            if project_config:
-                # Find matching document type in project config
-                for doc_type_config in project_config.document_types:
-                    # Map config name to enum value
-                    if doc_type_config.name == self.value:
-                        return {
-                            "display_name": doc_type_config.display_name,
-                            "display_name_en": doc_type_config.display_name_en,
-                            "key_fields": doc_type_config.key_fields,
-                            "content_fields": doc_type_config.content_fields,
-                            "index_name": doc_type_config.index_name,
-                            "semantic_config": doc_type_config.semantic_config,
-                            "vector_field": doc_type_config.vector_field,
-                            "category": doc_type_config.name  # Use name as category
-                        }
-        except Exception:
-            pass
+        entry = _configured_registry().get(self.value)
+        if entry:
+            return entry.categorized_metadata
 
         # Return None for unknown types - no fallback
         return None
@@ -151,25 +94,8 @@ class DocumentType(Enum):
     @classmethod
     def _get_metadata_for_type(cls, type_value: str):
         """Get metadata for a given document type value."""
-        try:
-            project_config = get_project_config()
-            if project_config:
-                for doc_type_config in project_config.document_types:
-                    if doc_type_config.name == type_value:
-                        return {
-                            "display_name": doc_type_config.display_name,
-                            "display_name_en": doc_type_config.display_name_en,
-                            "key_fields": doc_type_config.key_fields,
-                            "content_fields": doc_type_config.content_fields,
-                            "index_name": doc_type_config.index_name,
-                            "semantic_config": doc_type_config.semantic_config,
-                            "vector_field": doc_type_config.vector_field,
-                            # Remove business-specific category logic; use only
-                            # generic if needed
-                        }
-        except Exception:
-            pass
-        return None
+        entry = _configured_registry().get(type_value)
+        return entry.metadata if entry else None
 
     # Removed: _get_category_from_name_static (no business-specific or
     # keyword-based logic)
@@ -183,33 +109,13 @@ class DocumentType(Enum):
                 return member
 
         # Check configured types
-        configured_types = cls.get_configured_types()
-        if name in configured_types:
-            # Create a dynamic type object with proper equality
-            class DynamicDocumentType:
-                def __init__(self, value, name):
-                    self.value = value
-                    self.name = name.upper()
-
-                def __eq__(self, other):
-                    if isinstance(other, DocumentType):
-                        return self.value == other.value
-                    elif hasattr(other, 'value'):
-                        return self.value == other.value
-                    elif isinstance(other, str):
-                        return self.value == other
-                    return False
-
-                def __hash__(self):
-                    return hash(self.value)
-
-                def get_metadata(self):
-                    return cls._get_metadata_for_type(self.value)
-
-            return DynamicDocumentType(name, name)
+        registry = _configured_registry()
+        entry = registry.get(name)
+        if entry:
+            return entry.doc_type
 
         raise ValueError(f"Unknown document type: {name}. Available static types: {
-                         [m.value for m in cls]}, Configured types: {list(configured_types.keys())}")
+                         [m.value for m in cls]}, Configured types: {list(registry.keys())}")
 
     @classmethod
     def get_available_types(cls):
@@ -218,14 +124,21 @@ class DocumentType(Enum):
             member.value for member in cls if member != cls.WEB_SEARCH]
 
         # Add configured types
-        configured = cls.get_configured_types()
-        available.extend(configured.keys())
+        available.extend(_configured_registry().keys())
 
         return available
 
     @classmethod
     def get_available_types_with_metadata(cls):
-        """Get list of all available document types with their metadata."""
+        """Get list of all available document types with their metadata.
+
+        The entries are shared between callers and are read-only.
+        """
+        return list(_types_with_metadata(_current_project_config()))
+
+    @classmethod
+    def _collect_types_with_metadata(cls):
+        """Build the get_available_types_with_metadata() entries."""
         types_with_metadata = []
 
         # Add static types (except WEB_SEARCH)
@@ -233,35 +146,144 @@ class DocumentType(Enum):
             if member != cls.WEB_SEARCH:
                 metadata = member.get_metadata()
                 if metadata:
-                    types_with_metadata.append({
+                    types_with_metadata.append(MappingProxyType({
                         "name": member.value,
                         "metadata": metadata
-                    })
+                    }))
 
         # Add configured types
-        configured = cls.get_configured_types()
-        for name in configured.keys():
-            metadata = cls._get_metadata_for_type(name)
-            if metadata:
-                types_with_metadata.append({
-                    "name": name,
-                    "metadata": metadata
-                })
+        for name, entry in _configured_registry().items():
+            types_with_metadata.append(MappingProxyType({
+                "name": name,
+                "metadata": entry.metadata
+            }))
 
         return types_with_metadata
 
     @classmethod
     def create_dynamic_type(cls, name: str):
         """Create a dynamic document type from configuration."""
-        configured_types = cls.get_configured_types()
-        if name in configured_types:
+        if name in _configured_registry():
             return cls.from_name(name)
         else:
             raise ValueError(
                 f"Document type '{name}' not found in configuration")
 
 
-@dataclass
+class DynamicDocumentType:
+    """Enum-like document type defined in the project configuration."""
+
+    __slots__ = ("value", "name", "_metadata")
+
+    def __init__(self, value, name, metadata=None):
+        self.value = value
+        self.name = name.upper()
+        # Registry-built instances carry their metadata, so get_metadata()
+        # needs neither a configuration fetch nor a registry lookup
+        self._metadata = metadata
+
+    def __eq__(self, other):
+        return self.value == getattr(other, 'value', other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def get_metadata(self):
+        if self._metadata is not None:
+            return self._metadata
+        return DocumentType._get_metadata_for_type(self.value)
+
+
+# Metadata is shared between callers, so it is handed out read-only
+_WEB_SEARCH_METADATA = MappingProxyType({
+    "display_name": "Web Search",
+    "display_name_en": "Web Search",
+    "key_fields": ("url", "title", "content"),
+    "content_fields": ("content",),
+    "category": "web"
+})
+
+
+class _RegisteredType(NamedTuple):
+    """A configured document type with its pre-built metadata."""
+    doc_type: DynamicDocumentType
+    metadata: Mapping[str, Any]
+    # Same as metadata plus "category" (the type name), as returned by
+    # DocumentType.get_metadata()
+    categorized_metadata: Mapping[str, Any]
+
+
+@lru_cache(maxsize=1)
+def _document_type_registry(project_config) -> Dict[str, _RegisteredType]:
+    """Index the configured document types by name, once per configuration instance.
+
+    The first definition of a name wins, as with the previous linear scans.
+    Names are interned like the static member values, so comparisons between
+    document types usually resolve on identity.
+    """
+    registry = {}
+    for doc_type_config in project_config.document_types:
+        name = sys.intern(doc_type_config.name)
+        if name in registry:
+            continue
+        metadata = {
+            "display_name": doc_type_config.display_name,
+            "display_name_en": doc_type_config.display_name_en,
+            # Tuples so the shared metadata cannot be changed through them
+            "key_fields": tuple(doc_type_config.key_fields),
+            "content_fields": tuple(doc_type_config.content_fields),
+            "index_name": doc_type_config.index_name,
+            "semantic_config": doc_type_config.semantic_config,
+            "vector_field": doc_type_config.vector_field,
+        }
+        frozen_metadata = MappingProxyType(metadata)
+        registry[name] = _RegisteredType(
+            DynamicDocumentType(name, name, frozen_metadata),
+            frozen_metadata,
+            MappingProxyType({**metadata, "category": name}),
+        )
+    return registry
+
+
+def _current_project_config():
+    """Return the project configuration, or None if it cannot be loaded."""
+    try:
+        return get_project_config()
+    except Exception:
+        return None
+
+
+def _configured_registry() -> Dict[str, _RegisteredType]:
+    """Return the registry for the current project configuration, or {} if unavailable."""
+    project_config = _current_project_config()
+    if project_config:
+        try:
+            return _document_type_registry(project_config)
+        except Exception:
+            pass
+    return {}
+
+
+# The views below derive from the registry and are keyed on the same
+# configuration instance (None when it is unavailable)
+@lru_cache(maxsize=1)
+def _all_document_types(project_config) -> Mapping[str, Any]:
+    all_types = {member.value: member for member in DocumentType}
+    for name, entry in _configured_registry().items():
+        all_types.setdefault(name, entry.doc_type)
+    return MappingProxyType(all_types)
+
+
+@lru_cache(maxsize=1)
+def _types_with_metadata(project_config) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(DocumentType._collect_types_with_metadata())
+
+
+# Upper bound on candidates per search; the semantic ranker reranks at most 50
+MAX_CANDIDATE_K = 50
+
+
+@dataclass(slots=True)
 class SearchQuery:
     """Search query parameters."""
     text: str
@@ -270,9 +292,19 @@ class SearchQuery:
     use_hybrid_search: bool = True
     use_semantic_search: bool = True
     document_type: Optional[DocumentType] = None
+    # Candidates fetched per returned result for fusion/reranking
+    oversample_factor: int = 3
+    # efSearch of the backend's HNSW index when known; approximate search
+    # loses recall once more neighbours than this are requested
+    ef_search: Optional[int] = None
 
+    @property
+    def candidate_k(self) -> int:
+        """Number of candidates to retrieve before reranking down to top_k."""
+        return min(MAX_CANDIDATE_K, self.top_k * self.oversample_factor)
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchResult:
     """Search result data structure."""
     content_text: str
@@ -289,7 +321,7 @@ class SearchResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchStatistics:
     """Search provider statistics."""
     provider_name: str
@@ -318,6 +350,11 @@ class SearchProvider(ABC):
         """
         Perform search operation.
 
+        Implementations backed by an approximate vector index must not ask it
+        for more than ``query.ef_search`` neighbours; pass the value to the
+        backend, or fall back to its exact search when it cannot be set per
+        query.
+
         Args:
             query: Search query parameters
             document_type: Type of documents to search
@@ -360,6 +397,11 @@ class SearchProvider(ABC):
         """Get list of supported document types."""
         pass
 
+    @cached_property
+    def supported_document_types(self) -> Tuple[DocumentType, ...]:
+        """Supported document types, computed once per provider instance."""
+        return tuple(self.get_supported_document_types())
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
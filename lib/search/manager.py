@@ -397,7 +397,7 @@ class SearchManager:
         doc_types = {}
 
         for provider_name, provider in self.providers.items():
-            doc_types[provider_name] = provider.get_supported_document_types()
+            doc_types[provider_name] = list(provider.supported_document_types)
 
         return doc_types
 
@@ -427,7 +427,7 @@ class SearchManager:
             provider: SearchProvider,
             document_type: DocumentType) -> bool:
         """Check if provider supports the document type using value comparison."""
-        supported_types = provider.get_supported_document_types()
+        supported_types = provider.supported_document_types
 
         # Check for exact object match first
         if document_type in supported_types:
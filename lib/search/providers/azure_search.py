@@ -1,6 +1,7 @@
 """
 Azure AI Search provider implementation.
 """
+import asyncio
 import json
 import logging
 import uuid
@@ -27,6 +28,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Document types searched concurrently by search_all()
+SEARCH_ALL_CONCURRENCY = 8
+
 
 class AzureEmbeddingProvider(EmbeddingProvider):
     """Azure OpenAI embedding provider."""
@@ -43,7 +47,9 @@ class AzureEmbeddingProvider(EmbeddingProvider):
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding vector using Azure OpenAI."""
         try:
-            response = self.openai_client.embeddings.create(
+            # The client is synchronous; keep the event loop free meanwhile
+            response = await asyncio.to_thread(
+                self.openai_client.embeddings.create,
                 input=text,
                 model=self.embedding_model
             )
@@ -144,9 +150,14 @@ class AzureSearchProvider(SearchProvider):
     async def search(
         self,
         query: SearchQuery,
-        document_type: DocumentType
+        document_type: DocumentType,
+        query_vector: Optional[List[float]] = None
     ) -> List[SearchResult]:
-        """Perform search on specific document type."""
+        """Perform search on specific document type.
+
+        query_vector is the embedding of query.text when the caller has
+        already computed it; otherwise hybrid search generates it here.
+        """
         # Find matching client using value-based comparison
         client_doc_type = None
         for doc_type in self.search_clients.keys():
@@ -179,16 +190,27 @@ class AzureSearchProvider(SearchProvider):
             # Configure search mode
             if query.use_hybrid_search:
                 # Generate embedding for vector search
-                query_vector = await self.embedding_provider.generate_embedding(query.text)
+                if query_vector is None:
+                    query_vector = await self.embedding_provider.generate_embedding(query.text)
                 if query_vector:
                     vector_field = self.vector_field_map.get(
                         client_doc_type, "content_embedding")
 
+                    # efSearch is fixed in the index definition, so use exact
+                    # KNN when the candidate pool would exceed it
+                    exhaustive = (query.ef_search is not None
+                                  and query.candidate_k > query.ef_search)
+                    if exhaustive:
+                        logger.warning(
+                            f"candidate_k ({query.candidate_k}) exceeds ef_search "
+                            f"({query.ef_search}), using exhaustive vector search")
+
                     search_params["vector_queries"] = [
                         VectorizedQuery(
                             vector=query_vector,
-                            k_nearest_neighbors=query.top_k,
-                            fields=vector_field
+                            k_nearest_neighbors=query.candidate_k,
+                            fields=vector_field,
+                            exhaustive=exhaustive
                         )
                     ]
 
@@ -229,8 +251,10 @@ class AzureSearchProvider(SearchProvider):
                 else:
                     raise
 
-            # Process results
-            results = self._process_search_results(
+            # Process results; iterating the pager performs the blocking HTTP
+            # requests, so run it off the event loop
+            results = await asyncio.to_thread(
+                self._process_search_results,
                 search_results, client_doc_type, search_mode)
 
             logger.info(
@@ -256,43 +280,26 @@ class AzureSearchProvider(SearchProvider):
             f"Performing comprehensive search across all document types: '{
                 query.text}'")
 
-        all_results = []
-
-        for doc_type in self.get_supported_document_types():
-            try:
-                # Determine top_k for this document type
-                if top_k_per_source is not None:
-                    # Use explicitly provided top_k_per_source
-                    doc_type_top_k = top_k_per_source
-                else:
-                    # Use per-type top_k from search examples or default
-                    doc_type_top_k = self._get_per_type_top_k(
-                        doc_type, top_k_per_source)
-
-                # Create query for this document type
-                doc_query = SearchQuery(
-                    text=query.text,
-                    top_k=doc_type_top_k,
-                    filter_expression=query.filter_expression,
-                    use_hybrid_search=query.use_hybrid_search,
-                    use_semantic_search=query.use_semantic_search,
-                    document_type=doc_type
-                )
-
-                results = await self.search(doc_query, doc_type)
+        # Every document type searches the same text, so embed it once here
+        # instead of sending one identical embedding request per type
+        query_vector = None
+        if query.use_hybrid_search:
+            query_vector = await self.embedding_provider.generate_embedding(query.text)
 
-                # Add document type metadata
-                for result in results:
-                    if result.metadata is None:
-                        result.metadata = {}
-                    result.metadata["document_type"] = doc_type.value
-                    result.metadata["source_index"] = doc_type.value
+        semaphore = asyncio.Semaphore(SEARCH_ALL_CONCURRENCY)
 
-                all_results.extend(results)
+        async def search_document_type(doc_type: DocumentType) -> List[SearchResult]:
+            async with semaphore:
+                return await self._search_document_type(
+                    query, doc_type, top_k_per_source, query_vector)
 
-            except Exception as e:
-                logger.warning(f"Failed to search {doc_type.value}: {e}")
-                continue
+        # Results are gathered in document type order, so the stable sort
+        # below yields the same ordering as searching one type at a time
+        all_results = []
+        for results in await asyncio.gather(
+                *(search_document_type(doc_type)
+                  for doc_type in self.supported_document_types)):
+            all_results.extend(results)
 
         # Sort by relevance score
         all_results.sort(key=lambda x: x.score or 0, reverse=True)
@@ -302,6 +309,49 @@ class AzureSearchProvider(SearchProvider):
                 len(all_results)} total results")
         return all_results
 
+    async def _search_document_type(
+        self,
+        query: SearchQuery,
+        doc_type: DocumentType,
+        top_k_per_source: Optional[int],
+        query_vector: Optional[List[float]] = None
+    ) -> List[SearchResult]:
+        """Search one document type for search_all(); failures yield no results."""
+        try:
+            # Determine top_k for this document type
+            if top_k_per_source is not None:
+                # Use explicitly provided top_k_per_source
+                doc_type_top_k = top_k_per_source
+            else:
+                # Use per-type top_k from search examples or default
+                doc_type_top_k = self._get_per_type_top_k(
+                    doc_type, top_k_per_source)
+
+            # Create query for this document type
+            doc_query = SearchQuery(
+                text=query.text,
+                top_k=doc_type_top_k,
+                filter_expression=query.filter_expression,
+                use_hybrid_search=query.use_hybrid_search,
+                use_semantic_search=query.use_semantic_search,
+                document_type=doc_type
+            )
+
+            results = await self.search(doc_query, doc_type, query_vector)
+
+            # Add document type metadata
+            for result in results:
+                if result.metadata is None:
+                    result.metadata = {}
+                result.metadata["document_type"] = doc_type.value
+                result.metadata["source_index"] = doc_type.value
+
+            return results
+
+        except Exception as e:
+            logger.warning(f"Failed to search {doc_type.value}: {e}")
+            return []
+
     def _get_per_type_top_k(
             self,
             document_type: DocumentType,
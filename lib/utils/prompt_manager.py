@@ -16,6 +16,7 @@ class PromptManager:
     def __init__(self, project_config: ProjectConfig = None):
         """Initialize prompt manager with project configuration."""
         self.config = project_config or ProjectConfig()
+        self._search_functions_section: Optional[str] = None
 
     def get_company_context(self) -> Dict[str, str]:
         """Get company context for prompts."""
@@ -61,7 +62,14 @@ class PromptManager:
         return "\n".join(sections)
 
     def get_search_functions_section(self) -> str:
-        """Generate search functions section for prompts."""
+        """Generate search functions section for prompts.
+
+        The section only depends on this manager's configuration, so it is
+        built once and reused by every prompt that embeds it.
+        """
+        if self._search_functions_section is not None:
+            return self._search_functions_section
+
         sections = []
 
         for name, example in self.config.search_examples.items():
@@ -71,7 +79,8 @@ class PromptManager:
                 section += f"  - Query Examples: \"{examples_str}\"\n"
             sections.append(section)
 
-        return "\n".join(sections)
+        self._search_functions_section = "\n".join(sections)
+        return self._search_functions_section
 
     def get_domain_concepts_section(self) -> str:
         """Generate domain concepts section for prompts."""
@@ -50,6 +50,7 @@ from lib.agent_factory import create_agents_with_memory
 from lib.config import get_config
 from lib.memory import (MemoryPlugin, MemoryManager, SharedMemoryPluginSK,
                         create_azure_openai_text_embedding)
+from lib.prompts import warmup_prompts
 from lib.prompts.agents.final_answer import FINAL_ANSWER_PROMPT
 from lib.prompts.agents.manager import MANAGER_PROMPT
 from lib.util import dbg, get_azure_openai_service
@@ -291,6 +292,9 @@ async def main() -> None:
         config = get_config()
         logger.info("⚙️  Configuration validated")
 
+        # Render the memoized agent prompt bodies before the agents are created
+        warmup_prompts()
+
         # Initialize research agent
         agent = DeepResearchAgent()
         await agent.initialize()
@@ -0,0 +1,98 @@
+"""
+Prompt rendering tests.
+
+Run from the repository root with: python -m unittest discover -s tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.config import project_config  # noqa: E402
+
+TEMPLATE_CONFIG = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "config", "project_config_templates.yaml")
+
+FALLBACK_PROMPT = "Error generating prompt - please check configuration"
+
+
+def _load_config_without_company() -> project_config.ProjectConfig:
+    """Load the template configuration with its company section removed."""
+    with open(TEMPLATE_CONFIG, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    data.get("system", {}).pop("company", None)
+    data.pop("company", None)
+    with tempfile.NamedTemporaryFile(
+            "w", suffix=".yaml", delete=False, encoding="utf-8") as f:
+        yaml.safe_dump(data, f, allow_unicode=True)
+    try:
+        return project_config.ProjectConfig(f.name)
+    finally:
+        os.unlink(f.name)
+
+
+class PromptsWithoutCompanyTest(unittest.TestCase):
+    """The company section is optional, so every prompt must still render."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._saved_config = project_config._project_config
+        project_config._project_config = _load_config_without_company()
+
+    @classmethod
+    def tearDownClass(cls):
+        project_config._project_config = cls._saved_config
+
+    def test_config_has_no_company_name(self):
+        self.assertEqual(project_config.get_project_config().company.name, "")
+
+    def test_agent_prompts_render(self):
+        from lib.prompts import PROMPT_NAMES, get_prompt
+
+        for name in PROMPT_NAMES:
+            with self.subTest(prompt=name):
+                prompt = get_prompt(name)
+                self.assertTrue(prompt)
+                self.assertNotEqual(prompt, FALLBACK_PROMPT)
+
+    def test_temperature_researcher_prompts_render(self):
+        from lib.prompts.agents.researcher import \
+            get_temperature_researcher_prompt
+
+        for temperature_type in ("conservative", "balanced", "creative"):
+            with self.subTest(temperature_type=temperature_type):
+                prompt = get_temperature_researcher_prompt(temperature_type)
+                self.assertNotEqual(prompt, FALLBACK_PROMPT)
+
+    def test_placeholder_company_name(self):
+        from lib.prompts import get_prompt
+
+        self.assertIn("You are a Organization Summarizer Agent",
+                      get_prompt("summarizer"))
+
+    def test_lazy_prompt_constants(self):
+        from lib.prompts.agents import researcher, summarizer
+
+        self.assertNotIn("SUMMARIZER_PROMPT", vars(summarizer))
+        self.assertTrue(summarizer.SUMMARIZER_PROMPT)
+        self.assertIn("SUMMARIZER_PROMPT", vars(summarizer))
+        self.assertNotEqual(researcher.LEAD_RESEARCHER_PROMPT, FALLBACK_PROMPT)
+        with self.assertRaises(AttributeError):
+            summarizer.NO_SUCH_PROMPT
+
+    def test_warmup_builds_researcher_prompts(self):
+        from lib.prompts import warmup_prompts
+        from lib.prompts.agents import researcher
+
+        researcher._PROMPTS.clear()
+        warmup_prompts()
+        self.assertEqual(len(researcher._PROMPTS), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()